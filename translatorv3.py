@@ -20,41 +20,142 @@ This script creates a GUI application that:
 Ubuntu Setup:
 1. Install system dependencies (for pdf2image and OCR):
      sudo apt-get install poppler-utils tesseract-ocr
+   For OCR of non-English sources, also install the matching language data,
+   e.g. tesseract-ocr-kor, tesseract-ocr-deu, tesseract-ocr-chi-sim,
+   tesseract-ocr-spa.
 2. Create and activate a virtual environment, then install required Python packages:
      pip install PyPDF2 argostranslate reportlab pdf2image pillow pytesseract
+   (Installing pillow-simd instead of pillow gives AVX2-accelerated preview
+   resizing on supported CPUs.)
 3. Ensure you are connected to the internet to download language packages.
 """
 
+import glob
+import io
+import json
 import os
+import queue
+import tempfile
 import threading
+import time
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import PyPDF2
 from argostranslate import package, translate
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.pagesizes import letter
-from pdf2image import convert_from_path
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfgen import canvas as pdf_canvas
+from pdf2image import convert_from_path, convert_from_bytes
 from PIL import Image, ImageTk
 import pytesseract  # For OCR
 
-# Modified function: now accepts a page number.
-def get_pdf_preview_image(pdf_path, page_number=1):
+# Optional fast translation backend: drives the CTranslate2 model shipped
+# inside the installed Argos packages directly, skipping Argos's slow
+# per-sentence Python glue. Falls back to plain Argos when not installed.
+try:
+    import ctranslate2
+    import sentencepiece
+    import pysbd
+except ImportError:
+    ctranslate2 = None
+
+# Optional GPU OCR backend; Tesseract stays the default on CPU-only boxes.
+try:
+    import easyocr
+    import numpy as np
+except ImportError:
+    easyocr = None
+
+# Keep each Tesseract process single-threaded; we parallelize across pages
+# instead, which scales better than Tesseract's internal OpenMP threading.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# Worker threads for poppler's rasterizer; leave one core for the GUI.
+_PDF_THREAD_COUNT = max(1, (os.cpu_count() or 2) - 1)
+
+# Open a PDF with a 1 MiB read buffer. PyPDF2's xref and stream scanning
+# issues many tiny reads; the default buffer turns those into a syscall
+# storm on image-heavy (e.g. scanned) files.
+def _open_pdf(pdf_path):
+    return io.BufferedReader(io.FileIO(pdf_path, 'r'), buffer_size=1 << 20)
+
+# Render one page of a PDF (path or in-memory bytes) to a PIL image.
+# `convert` is convert_from_path or convert_from_bytes to match `source`.
+def _render_pdf_page(convert, source, page_number, target_height=None):
+    tmpdir = tempfile.mkdtemp(prefix="pdftranslator_preview_")
     try:
-        images = convert_from_path(pdf_path, dpi=100, first_page=page_number, last_page=page_number)
-        if images:
-            return images[0]
+        # Render to a temp file (paths_only) instead of an in-memory ppm,
+        # and use pdftocairo which is faster than pdftoppm on many builds.
+        # When the caller knows the display height, let poppler scale to it
+        # in-process rather than rasterizing at full DPI and shrinking later;
+        # rasterization cost grows with the square of the resolution.
+        if target_height:
+            render_kwargs = {'size': (None, target_height)}
+        else:
+            render_kwargs = {'dpi': 100}
+        image_paths = convert(
+            source, first_page=page_number, last_page=page_number,
+            thread_count=_PDF_THREAD_COUNT, use_pdftocairo=True,
+            output_folder=tmpdir, paths_only=True, **render_kwargs)
+        if image_paths:
+            with Image.open(image_paths[0]) as img:
+                return img.copy()
         else:
             raise Exception("No pages found in PDF.")
     except Exception as e:
         raise Exception("Error generating preview image: " + str(e))
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+# Cached single-page render. Keyed on the file's mtime as well, so a
+# rewritten file is not served from a stale cache entry.
+@lru_cache(maxsize=16)
+def _render_preview(pdf_path, page_number, mtime, target_height=None):
+    return _render_pdf_page(convert_from_path, pdf_path, page_number,
+                            target_height)
+
+# Modified function: now accepts a page number and an optional target height
+# (in pixels) to render no larger than the widget that will show the image.
+def get_pdf_preview_image(pdf_path, page_number=1, target_height=None):
+    return _render_preview(pdf_path, page_number, os.path.getmtime(pdf_path),
+                           target_height)
+
+# Warm the preview cache for a page without surfacing render errors; the
+# page may not exist or may still be regenerating, and the foreground
+# display path reports real failures anyway.
+def prefetch_preview_image(pdf_path, page_number, target_height=None):
+    try:
+        get_pdf_preview_image(pdf_path, page_number, target_height)
+    except Exception:
+        pass
+
+# Cache recording which required pairs were last seen installed, so startup
+# can skip the network package-index refresh; installed packs rarely change.
+_PAIR_CACHE_PATH = Path('~/.cache/pdftranslator/pairs.json').expanduser()
+_PAIR_CACHE_MAX_AGE = 7 * 86400
+
+def _read_pair_cache():
+    try:
+        if time.time() - _PAIR_CACHE_PATH.stat().st_mtime < _PAIR_CACHE_MAX_AGE:
+            return [tuple(pair) for pair in
+                    json.loads(_PAIR_CACHE_PATH.read_text())]
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_pair_cache(pairs):
+    try:
+        _PAIR_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _PAIR_CACHE_PATH.write_text(json.dumps(sorted(pairs)))
+    except OSError:
+        pass
 
 # Automatically install required language pairs.
 def install_required_language_pairs():
-    print("Updating package index...")
-    package.update_package_index()
-    available_packages = package.get_available_packages()
     # Required language pairs: (source, target)
     required_pairs = [
         ('ko','en'), ('en','ko'),
@@ -62,7 +163,14 @@ def install_required_language_pairs():
         ('zh','en'), ('en','zh'),
         ('es','en'), ('en','es')
     ]
-    installed_langs = translate.get_installed_languages()
+    cached_pairs = _read_pair_cache()
+    if cached_pairs is not None and all(pair in cached_pairs
+                                        for pair in required_pairs):
+        return
+    print("Updating package index...")
+    package.update_package_index()
+    available_packages = package.get_available_packages()
+    installed_langs = get_installed_languages()
 
     def is_pair_installed(src, tgt, installed_langs):
         for lang in installed_langs:
@@ -72,6 +180,7 @@ def install_required_language_pairs():
                         return True
         return False
 
+    missing_packages = []
     for src, tgt in required_pairs:
         if not is_pair_installed(src, tgt, installed_langs):
             found_package = None
@@ -80,71 +189,535 @@ def install_required_language_pairs():
                     found_package = pkg
                     break
             if found_package:
-                print(f"Installing language package for {src} -> {tgt}...")
-                pkg_path = found_package.download()
-                package.install_from_path(pkg_path)
-                installed_langs = translate.get_installed_languages()
+                missing_packages.append(found_package)
             else:
                 print(f"No available package found for {src} -> {tgt}.")
 
-# Extract text from PDF with OCR fallback. Updates progress (50% total).
-def extract_text_from_pdf(pdf_path, progress_callback=None):
-    text = ""
+    def download_and_install(pkg):
+        print(f"Installing language package for {pkg.from_code} -> {pkg.to_code}...")
+        package.install_from_path(pkg.download())
+
+    if missing_packages:
+        # Each download+install is independent network/disk I/O, so a few
+        # at a time overlaps nicely.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(download_and_install, missing_packages))
+        installed_langs = get_installed_languages(refresh=True)
+    _write_pair_cache([pair for pair in required_pairs
+                       if is_pair_installed(pair[0], pair[1], installed_langs)])
+
+# Otsu's threshold over a 256-bin grayscale histogram: pick the level that
+# maximizes the between-class variance of background and foreground.
+def _otsu_threshold(histogram):
+    total = sum(histogram)
+    sum_total = sum(i * count for i, count in enumerate(histogram))
+    sum_bg = 0.0
+    weight_bg = 0
+    best_threshold = 127
+    best_variance = 0.0
+    for i, count in enumerate(histogram):
+        weight_bg += count
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+        sum_bg += i * count
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_total - sum_bg) / weight_fg
+        variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            best_threshold = i
+    return best_threshold
+
+# Grayscale and binarize a rendered page; Tesseract classifies one bilevel
+# plane noticeably faster than three RGB planes.
+def _binarize_for_ocr(image_path):
+    with Image.open(image_path) as img:
+        gray = img.convert('L')
+    threshold = _otsu_threshold(gray.histogram())
+    return gray.point(lambda v: 255 if v > threshold else 0, mode='1')
+
+# Tesseract codes for the app's supported source languages; OCR in one of
+# these needs the matching tesseract-ocr-<code> system package.
+_TESS_LANGS = {'ko': 'kor', 'en': 'eng', 'de': 'deu', 'zh': 'chi_sim',
+               'es': 'spa'}
+
+# OCR a single rendered page image (one single-threaded Tesseract process).
+# --oem 1 selects the LSTM engine only (the combined legacy+LSTM default is
+# slower), and --psm 6 skips layout detection on uniform text pages.
+def _ocr_image(image_path, lang=None):
+    return pytesseract.image_to_string(
+        _binarize_for_ocr(image_path), lang=lang,
+        config='--oem 1 --psm 6 -c tessedit_do_invert=0')
+
+# Default OCR backend: one single-threaded Tesseract process per core
+# (OMP_THREAD_LIMIT=1 is set at import), which outperforms a single
+# multi-threaded Tesseract.
+class TesseractOCRBackend:
+    def batch(self, image_paths, progress_callback=None, ocr_lang=None):
+        lang = _TESS_LANGS.get(ocr_lang)
+        results = [None] * len(image_paths)
+        done_count = [0]
+        progress_lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for idx, ocr_text in enumerate(
+                    executor.map(partial(_ocr_image, lang=lang),
+                                 image_paths)):
+                results[idx] = ocr_text
+                if progress_callback:
+                    with progress_lock:
+                        done_count[0] += 1
+                        progress_callback(done_count[0], len(image_paths))
+        return results
+
+# EasyOCR codes for the app's supported source languages.
+_EASYOCR_LANGS = {'ko': 'ko', 'en': 'en', 'de': 'de', 'zh': 'ch_sim',
+                  'es': 'es'}
+
+# GPU OCR backend: loads the EasyOCR model for the requested source
+# language once and pushes all pages through readtext_batched, so the CUDA
+# model load and kernel autotuning are paid per language switch, not per
+# page. Languages EasyOCR cannot serve fall back to Tesseract, which with
+# the right traineddata beats GPU OCR in the wrong language.
+class EasyOCRBackend:
+    def __init__(self):
+        self.reader = None
+        self.reader_lang = None
+        self.fallback = TesseractOCRBackend()
+
+    def _get_reader(self, easyocr_lang):
+        if self.reader is None or self.reader_lang != easyocr_lang:
+            langs = [easyocr_lang] if easyocr_lang == 'en' else [easyocr_lang, 'en']
+            self.reader = easyocr.Reader(langs, gpu=True,
+                                         cudnn_benchmark=True)
+            self.reader_lang = easyocr_lang
+            # Warm-up pass so the first real page is not charged for CUDA
+            # context setup and cudnn benchmarking.
+            warmup = [np.zeros((600, 800, 3), dtype=np.uint8)] * 2
+            self.reader.readtext_batched(warmup, n_width=800, n_height=1100)
+        return self.reader
+
+    def batch(self, image_paths, progress_callback=None, ocr_lang=None):
+        easyocr_lang = _EASYOCR_LANGS.get(ocr_lang or 'en')
+        if easyocr_lang is None:
+            return self.fallback.batch(image_paths, progress_callback,
+                                       ocr_lang=ocr_lang)
+        reader = self._get_reader(easyocr_lang)
+        images = [np.array(Image.open(p).convert('RGB'))
+                  for p in image_paths]
+        results = reader.readtext_batched(
+            images, n_width=800, n_height=1100, detail=0, paragraph=True)
+        if progress_callback:
+            progress_callback(len(image_paths), len(image_paths))
+        return ["\n".join(lines) for lines in results]
+
+# Chosen lazily: EasyOCR when requested via OCR_BACKEND=easyocr or when a
+# CUDA GPU is available, Tesseract otherwise. OCR_BACKEND=tesseract forces
+# the default even on GPU boxes.
+_OCR_BACKEND = None
+
+def get_ocr_backend():
+    global _OCR_BACKEND
+    if _OCR_BACKEND is None:
+        choice = os.environ.get('OCR_BACKEND', '').lower()
+        use_easyocr = False
+        if easyocr is not None and choice != 'tesseract':
+            if choice == 'easyocr':
+                use_easyocr = True
+            elif not choice:
+                try:
+                    import torch
+                    use_easyocr = torch.cuda.is_available()
+                except ImportError:
+                    pass
+        _OCR_BACKEND = EasyOCRBackend() if use_easyocr else TesseractOCRBackend()
+    return _OCR_BACKEND
+
+# Run OCR on the given pages in one batch: render them with a single poppler
+# call, then hand the rendered images to the active OCR backend. Returns
+# {page_number: ocr_text}.
+def ocr_pdf_pages(pdf_path, page_numbers, progress_callback=None,
+                  ocr_lang=None):
+    if not page_numbers:
+        return {}
+    tmpdir = tempfile.mkdtemp(prefix="pdftranslator_ocr_")
     try:
-        with open(pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            num_pages = len(reader.pages)
-            for i, page in enumerate(reader.pages, start=1):
-                page_text = page.extract_text()
-                if page_text and page_text.strip():
-                    text += page_text + "\n"
-                else:
-                    try:
-                        images = convert_from_path(pdf_path, dpi=200, first_page=i, last_page=i)
-                        if images:
-                            ocr_text = pytesseract.image_to_string(images[0])
-                            text += ocr_text + "\n"
-                    except Exception as ocr_e:
-                        raise Exception(f"Error during OCR on page {i}: " + str(ocr_e))
+        # Poppler only renders contiguous ranges, so issue one call per
+        # contiguous run of OCR pages. Rendering min..max in one go would
+        # rasterize every intermediate page of a sparse mixed document
+        # (e.g. 499 throwaway pages when only pages 2 and 500 need OCR);
+        # fully-scanned documents still collapse to a single render.
+        needed = sorted(page_numbers)
+        runs = []
+        run_start = prev = needed[0]
+        for i in needed[1:]:
+            if i != prev + 1:
+                runs.append((run_start, prev))
+                run_start = i
+            prev = i
+        runs.append((run_start, prev))
+        rendered = {}
+        for first, last in runs:
+            image_paths = convert_from_path(
+                pdf_path, dpi=200, first_page=first, last_page=last,
+                thread_count=_PDF_THREAD_COUNT, output_folder=tmpdir,
+                paths_only=True)
+            rendered.update(zip(range(first, last + 1), image_paths))
+        texts = get_ocr_backend().batch([rendered[i] for i in needed],
+                                        progress_callback, ocr_lang=ocr_lang)
+        return dict(zip(needed, texts))
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+# Cheap scanned-page test: a page whose resource dictionary lists no fonts
+# cannot produce any text, so PyPDF2's full content-stream tokenization can
+# be skipped and the page routed straight to OCR. Errs on the side of
+# extracting when the resources cannot be read.
+def _is_scanned_page(page):
+    try:
+        resources = page.get('/Resources')
+        if resources is None:
+            return True
+        return not resources.get_object().get('/Font')
+    except Exception:
+        return False
+
+# Yield (page_number, text) for every page of the PDF. Pages with embedded
+# text are yielded as soon as they are extracted; pages that need OCR are
+# collected and handled in one batched, parallel pass at the end. Progress
+# covers 0-50% of the bar.
+def iter_page_texts(pdf_path, progress_callback=None, reader=None,
+                    ocr_lang=None):
+    # Reuse a caller-supplied PdfReader when available; re-parsing the xref
+    # table on every call is wasted work on large files.
+    file = None
+    if reader is None:
+        file = _open_pdf(pdf_path)
+        reader = PyPDF2.PdfReader(file, strict=False)
+    try:
+        # Materialize the page list once; reader.pages resolves objects on
+        # every traversal.
+        pages = list(reader.pages)
+        num_pages = len(pages)
+        ocr_pages = []
+        for i, page in enumerate(pages, start=1):
+            page_text = None if _is_scanned_page(page) else page.extract_text()
+            if page_text and page_text.strip():
+                yield i, page_text
+            else:
+                ocr_pages.append(i)
+            if progress_callback:
+                progress_callback((i / num_pages) * 25)
+        if ocr_pages:
+            def ocr_progress(done, total):
                 if progress_callback:
-                    progress_callback((i / num_pages) * 50)
+                    progress_callback(25 + (done / total) * 25)
+            try:
+                ocr_results = ocr_pdf_pages(pdf_path, ocr_pages,
+                                            progress_callback=ocr_progress,
+                                            ocr_lang=ocr_lang)
+            except Exception as ocr_e:
+                raise Exception("Error during OCR: " + str(ocr_e))
+            for i in ocr_pages:
+                yield i, ocr_results.get(i, "")
+        if progress_callback:
+            progress_callback(50)
+    finally:
+        if file is not None:
+            file.close()
+
+# Extract text from PDF with OCR fallback. Updates progress (50% total).
+def extract_text_from_pdf(pdf_path, progress_callback=None, reader=None,
+                          ocr_lang=None):
+    try:
+        page_texts = dict(iter_page_texts(pdf_path, progress_callback,
+                                          reader=reader, ocr_lang=ocr_lang))
+        # Join once at the end; repeated "text += page" copies the whole
+        # accumulated string on every page, which is quadratic on big PDFs.
+        text = "\n".join(page_texts[i] for i in sorted(page_texts))
     except Exception as e:
         raise Exception("Error extracting text from PDF: " + str(e))
     if not text.strip():
         raise Exception("No text could be extracted from the PDF.")
     return text
 
-# Translate text using Argos Translate.
+# Extract and translate a PDF with the two stages overlapped: a producer
+# thread feeds extracted/OCR'd pages through a bounded queue while this
+# thread translates them as they arrive, so wall time approaches the
+# slower stage rather than the sum of both. Progress: extraction 0-50%,
+# translation 50-75%.
+def translate_pdf_text(pdf_path, from_lang_code, to_lang_code,
+                       progress_callback=None, reader=None):
+    page_q = queue.Queue(maxsize=8)
+    state = {'num_pages': 0, 'error': None}
+
+    # The stages report concurrently (extraction 0-50, translation 50-75),
+    # so only ever emit the running maximum; otherwise the bar jumps
+    # backwards whenever an extraction update lands after a translation one.
+    if progress_callback is not None:
+        report = progress_callback
+        max_seen = [0.0]
+        progress_lock = threading.Lock()
+
+        def progress_callback(value):
+            with progress_lock:
+                if value > max_seen[0]:
+                    max_seen[0] = value
+                    report(value)
+
+    def produce():
+        try:
+            if reader is not None:
+                state['num_pages'] = len(reader.pages)
+            else:
+                with _open_pdf(pdf_path) as f:
+                    state['num_pages'] = len(
+                        PyPDF2.PdfReader(f, strict=False).pages)
+            # The document's source language is also the OCR language.
+            for item in iter_page_texts(pdf_path, progress_callback,
+                                        reader=reader,
+                                        ocr_lang=from_lang_code):
+                page_q.put(item)
+        except Exception as e:
+            state['error'] = e
+        finally:
+            page_q.put(None)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    translated = {}
+    try:
+        while True:
+            item = page_q.get()
+            if item is None:
+                break
+            i, page_text = item
+            if page_text.strip():
+                translated[i] = translate_text(page_text, from_lang_code,
+                                               to_lang_code)
+            else:
+                translated[i] = ""
+            if progress_callback and state['num_pages']:
+                progress_callback(
+                    50 + min(25, (len(translated) / state['num_pages']) * 25))
+    except Exception:
+        # The producer blocks on the bounded queue; drain to the sentinel so
+        # it can finish (and iter_page_texts can close its file) before the
+        # translation error propagates.
+        while page_q.get() is not None:
+            pass
+        producer.join()
+        raise
+    producer.join()
+    if state['error'] is not None:
+        raise Exception("Error extracting text from PDF: " +
+                        str(state['error']))
+    if not any(t.strip() for t in translated.values()):
+        raise Exception("No text could be extracted from the PDF.")
+    return "\n".join(translated[i] for i in sorted(translated))
+
+# Fast translation backend built on the CTranslate2 model inside an installed
+# Argos package. Sentence-splits with pysbd, SentencePiece-encodes everything,
+# and decodes the whole document in one batched call.
+class CTranslate2Translator:
+    def __init__(self, package_dir, source_lang='en', intra_threads=None):
+        self.model = ctranslate2.Translator(
+            os.path.join(package_dir, 'model'), compute_type='int8',
+            inter_threads=1,
+            intra_threads=intra_threads or os.cpu_count())
+        self.sp = sentencepiece.SentencePieceProcessor(
+            model_file=os.path.join(package_dir, 'sentencepiece.model'))
+        # Segment with the source language's rules; English rules mis-split
+        # other languages (Chinese sentences end with 。, for example).
+        try:
+            self.segmenter = pysbd.Segmenter(language=source_lang,
+                                             clean=False)
+        except ValueError:
+            self.segmenter = pysbd.Segmenter(clean=False)
+
+    def translate(self, text):
+        lines = text.split('\n')
+        sentences = []
+        line_slices = []
+        for line in lines:
+            segments = self.segmenter.segment(line) if line.strip() else []
+            line_slices.append((len(sentences), len(segments)))
+            sentences.extend(segments)
+        if not sentences:
+            return text
+        tokens = self.sp.encode(sentences, out_type=str)
+        results = self.model.translate_batch(
+            tokens, max_batch_size=64, beam_size=1)
+        translated = [self.sp.decode(r.hypotheses[0]) for r in results]
+        out_lines = []
+        for (start, count), line in zip(line_slices, lines):
+            if count:
+                out_lines.append(' '.join(translated[start:start + count]))
+            else:
+                out_lines.append(line)
+        return '\n'.join(out_lines)
+
+# Locate the on-disk directory of an installed Argos package for a pair.
+def _find_argos_package_dir(from_code, to_code):
+    base = os.path.expanduser('~/.local/share/argos-translate/packages')
+    pattern = os.path.join(base, f'translate-{from_code}_{to_code}-*')
+    for candidate in sorted(glob.glob(pattern)):
+        if os.path.isdir(os.path.join(candidate, 'model')):
+            return candidate
+    return None
+
+# Loaded CTranslate2 translators, keyed by (from_code, to_code); loading the
+# model is expensive, so reuse one instance across calls.
+_CT2_CACHE = {}
+
+# Argos translation objects, keyed by (from_code, to_code); Argos loads its
+# model lazily on the first .translate(), so reuse the object across calls.
+_TRANS_CACHE = {}
+
+# Cached translate.get_installed_languages() result; walking the package dirs
+# on every call is slow, so refresh only after installing a new package.
+_INSTALLED_LANGUAGES = None
+
+def get_installed_languages(refresh=False):
+    global _INSTALLED_LANGUAGES
+    if _INSTALLED_LANGUAGES is None or refresh:
+        _INSTALLED_LANGUAGES = translate.get_installed_languages()
+    return _INSTALLED_LANGUAGES
+
+def _get_ct2_translator(from_lang_code, to_lang_code):
+    if ctranslate2 is None:
+        return None
+    key = (from_lang_code, to_lang_code)
+    if key not in _CT2_CACHE:
+        package_dir = _find_argos_package_dir(from_lang_code, to_lang_code)
+        _CT2_CACHE[key] = (CTranslate2Translator(package_dir,
+                                                 source_lang=from_lang_code)
+                           if package_dir else None)
+    return _CT2_CACHE[key]
+
+# Per-worker CT2 translator for the multiprocessing path, created once by
+# the pool initializer. Each worker runs single-threaded so N workers x 1
+# thread saturate the cores without oversubscription.
+_WORKER_TRANSLATOR = None
+
+def _init_worker_translator(from_lang_code, to_lang_code):
+    global _WORKER_TRANSLATOR
+    package_dir = _find_argos_package_dir(from_lang_code, to_lang_code)
+    _WORKER_TRANSLATOR = CTranslate2Translator(
+        package_dir, source_lang=from_lang_code, intra_threads=1)
+
+def _translate_chunk(chunk):
+    return _WORKER_TRANSLATOR.translate(chunk)
+
+# Documents with at least this many paragraphs are worth the pool startup
+# cost of the multiprocessing path below.
+_MP_PARAGRAPH_THRESHOLD = 200
+
+# Split the document into one contiguous paragraph chunk per core and
+# translate the chunks in worker processes, each with its own
+# single-threaded CT2 model.
+def _translate_multiprocess(text, from_lang_code, to_lang_code):
+    paragraphs = text.split('\n\n')
+    workers = min(os.cpu_count() or 1, len(paragraphs))
+    chunk_size = -(-len(paragraphs) // workers)
+    chunks = ['\n\n'.join(paragraphs[i:i + chunk_size])
+              for i in range(0, len(paragraphs), chunk_size)]
+    with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker_translator,
+            initargs=(from_lang_code, to_lang_code)) as executor:
+        return '\n\n'.join(executor.map(_translate_chunk, chunks))
+
+# Translate text, preferring the CTranslate2 backend when available and
+# falling back to Argos Translate otherwise.
 def translate_text(text, from_lang_code, to_lang_code):
     try:
-        installed_languages = translate.get_installed_languages()
-        from_lang_obj = None
-        to_lang_obj = None
-        for lang in installed_languages:
-            if lang.code == from_lang_code:
-                from_lang_obj = lang
-            if lang.code == to_lang_code:
-                to_lang_obj = lang
-        if not from_lang_obj or not to_lang_obj:
-            raise Exception("Translation packages for the selected language pair are not installed.")
-        translation = from_lang_obj.get_translation(to_lang_obj)
-        return translation.translate(text)
+        translator = _get_ct2_translator(from_lang_code, to_lang_code)
+        if translator is not None:
+            if ((os.cpu_count() or 1) > 1 and
+                    text.count('\n\n') + 1 >= _MP_PARAGRAPH_THRESHOLD):
+                return _translate_multiprocess(text, from_lang_code,
+                                               to_lang_code)
+            return translator.translate(text)
+        key = (from_lang_code, to_lang_code)
+        translation = _TRANS_CACHE.get(key)
+        if translation is None:
+            from_lang_obj = None
+            to_lang_obj = None
+            for lang in get_installed_languages():
+                if lang.code == from_lang_code:
+                    from_lang_obj = lang
+                if lang.code == to_lang_code:
+                    to_lang_obj = lang
+            if not from_lang_obj or not to_lang_obj:
+                raise Exception("Translation packages for the selected language pair are not installed.")
+            translation = from_lang_obj.get_translation(to_lang_obj)
+            _TRANS_CACHE[key] = translation
+        # Feed Argos bounded batches of paragraphs rather than the whole
+        # document in one string: one giant call spikes memory, while one
+        # call per paragraph pays Argos's per-call overhead repeatedly.
+        paragraphs = text.split('\n\n')
+        translated_paragraphs = []
+        batch = []
+        batch_lines = 0
+        for para in paragraphs:
+            batch.append(para)
+            batch_lines += para.count('\n') + 1
+            if batch_lines >= 64:
+                translated_paragraphs.append(
+                    translation.translate('\n\n'.join(batch)))
+                batch = []
+                batch_lines = 0
+        if batch:
+            translated_paragraphs.append(
+                translation.translate('\n\n'.join(batch)))
+        return '\n\n'.join(translated_paragraphs)
     except Exception as e:
         raise Exception("Error during translation: " + str(e))
 
-# Create a formatted PDF using ReportLab.
-def create_translated_pdf(text, output_pdf_path):
+# Layout for the generated PDF; matches the old 'Normal' stylesheet look.
+_PAGE_WIDTH, _PAGE_HEIGHT = letter
+_MARGIN = 72
+_FONT_NAME = 'Helvetica'
+_FONT_SIZE = 10
+_LEADING = 12
+_PARA_SPACE = 12
+
+# Create a formatted PDF using ReportLab. `output` may be a path or a
+# file-like object such as BytesIO. The text is plain, so it is drawn
+# straight onto a pdfgen canvas with textLine calls; building a Paragraph
+# flowable per paragraph re-parses markup and runs a layout pass each
+# time, which is several times slower for the same visual result.
+def create_translated_pdf(text, output):
     try:
-        doc = SimpleDocTemplate(output_pdf_path, pagesize=letter)
-        styles = getSampleStyleSheet()
-        story = []
-        paragraphs = text.split('\n\n')
-        for para in paragraphs:
-            para = para.replace('\n', ' ')
-            if para.strip():
-                story.append(Paragraph(para.strip(), styles["Normal"]))
-                story.append(Spacer(1, 12))
-        doc.build(story)
+        c = pdf_canvas.Canvas(output, pagesize=letter)
+        max_width = _PAGE_WIDTH - 2 * _MARGIN
+        top = _PAGE_HEIGHT - _MARGIN
+
+        def new_page_text():
+            t = c.beginText(_MARGIN, top)
+            t.setFont(_FONT_NAME, _FONT_SIZE, leading=_LEADING)
+            return t
+
+        text_obj = new_page_text()
+        y = top
+        for para in text.split('\n\n'):
+            para = para.replace('\n', ' ').strip()
+            if not para:
+                continue
+            for line in simpleSplit(para, _FONT_NAME, _FONT_SIZE, max_width):
+                if y < _MARGIN + _LEADING:
+                    c.drawText(text_obj)
+                    c.showPage()
+                    text_obj = new_page_text()
+                    y = top
+                text_obj.textLine(line)
+                y -= _LEADING
+            text_obj.moveCursor(0, _PARA_SPACE)
+            y -= _PARA_SPACE
+        c.drawText(text_obj)
+        c.save()
     except Exception as e:
         raise Exception("Error creating translated PDF: " + str(e))
 
@@ -156,7 +729,14 @@ class PDFTranslatorApp:
         # Allow window resizing.
         master.resizable(True, True)
         self.input_pdf_path = None
-        self.output_pdf_path = "translated.pdf"
+        # Parsed once per selected file and shared by page counting and
+        # extraction, instead of re-opening the PDF at each step.
+        self.reader = None
+        self.reader_bytes = None
+        # The generated PDF stays in memory until the user saves it; the
+        # preview renders straight from these bytes.
+        self.translated_bytes = None
+        self.translated_preview_cache = {}
         self.original_current_page = 1
         self.original_total_pages = 0
         self.translated_current_page = 1
@@ -182,32 +762,21 @@ class PDFTranslatorApp:
         self.target_lang_label = tk.Label(control_frame, text="Target Language:")
         self.target_lang_label.grid(row=2, column=0, padx=5, pady=5, sticky="e")
 
-        self.installed_languages = translate.get_installed_languages()
-        self.language_options = {}
-        for lang in self.installed_languages:
-            name = getattr(lang, "name", lang.code)
-            display = f"{name} ({lang.code})"
-            self.language_options[display] = lang.code
-
-        if not self.language_options:
-            messagebox.showerror("Error", "No languages installed in Argos Translate.\nPlease install language packages.")
-            master.quit()
-
-        language_list = list(self.language_options.keys())
-        self.source_lang_combo = ttk.Combobox(control_frame, values=language_list, state="readonly")
+        self.source_lang_combo = ttk.Combobox(control_frame, state="readonly")
         self.source_lang_combo.grid(row=1, column=1, padx=5, pady=5)
-        self.source_lang_combo.current(0)
-        self.target_lang_combo = ttk.Combobox(control_frame, values=language_list, state="readonly")
+        self.target_lang_combo = ttk.Combobox(control_frame, state="readonly")
         self.target_lang_combo.grid(row=2, column=1, padx=5, pady=5)
-        if len(language_list) > 1:
-            self.target_lang_combo.current(1)
-        else:
-            self.target_lang_combo.current(0)
+        self.refresh_language_options()
 
-        # Translate button.
-        self.translate_button = tk.Button(control_frame, text="Translate PDF", command=self.translate_pdf)
+        # Translate button. Disabled until language packs are confirmed
+        # installed (see start_language_install).
+        self.translate_button = tk.Button(control_frame, text="Translate PDF", command=self.translate_pdf, state=tk.DISABLED)
         self.translate_button.grid(row=3, column=0, columnspan=2, padx=5, pady=10)
 
+        # Status label for the background language-pack installation.
+        self.status_label = tk.Label(control_frame, text="Installing language packs...")
+        self.status_label.grid(row=6, column=0, columnspan=2, padx=5, pady=2)
+
         # Progress bar.
         self.progress_bar = ttk.Progressbar(control_frame, orient="horizontal", length=300, mode="determinate", maximum=100)
         self.progress_bar.grid(row=4, column=0, columnspan=2, padx=5, pady=5)
@@ -250,19 +819,90 @@ class PDFTranslatorApp:
         self.original_image_tk = None
         self.translated_image_tk = None
 
+    # (Re)populate the language comboboxes from the installed packages.
+    def refresh_language_options(self):
+        self.installed_languages = get_installed_languages()
+        self.language_options = {}
+        for lang in self.installed_languages:
+            name = getattr(lang, "name", lang.code)
+            display = f"{name} ({lang.code})"
+            self.language_options[display] = lang.code
+        language_list = list(self.language_options.keys())
+        self.source_lang_combo.config(values=language_list)
+        self.target_lang_combo.config(values=language_list)
+        if language_list:
+            self.source_lang_combo.current(0)
+            if len(language_list) > 1:
+                self.target_lang_combo.current(1)
+            else:
+                self.target_lang_combo.current(0)
+
+    # Install missing language packs in the background so the window shows
+    # immediately; the Translate button stays disabled until this finishes.
+    def start_language_install(self):
+        threading.Thread(target=self._bg_install, daemon=True).start()
+
+    def _bg_install(self):
+        try:
+            install_required_language_pairs()
+        except Exception as e:
+            print("Language pack installation failed: " + str(e))
+        self.master.after(0, self._enable_ui)
+
+    def _enable_ui(self):
+        self.refresh_language_options()
+        if self.language_options:
+            self.status_label.config(text="")
+            self.translate_button.config(state=tk.NORMAL)
+        else:
+            self.status_label.config(text="No languages installed.")
+            messagebox.showerror("Error", "No languages installed in Argos Translate.\nPlease install language packages.")
+
     def update_progress(self, value):
         self.master.after(0, lambda: self.progress_bar.config(value=value))
 
+    # Usable height of a preview canvas, or None before the first layout
+    # pass (winfo_height reports 1 until the window is drawn).
+    @staticmethod
+    def canvas_height(canvas):
+        height = canvas.winfo_height()
+        return height if height > 50 else None
+
+    # Downscale in PIL (fast C resampling) before handing the image to Tk;
+    # PhotoImage otherwise keeps the full-resolution bitmap in memory and
+    # pays for it on every blit. Copies first so cached renders stay intact.
+    @staticmethod
+    def fit_to_canvas(img, canvas):
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        if width > 50 and height > 50 and (img.width > width or
+                                           img.height > height):
+            img = img.copy()
+            img.thumbnail((width, height), Image.Resampling.LANCZOS)
+        return img
+
+    # Render the neighbouring pages in the background so Prev/Next hits the
+    # preview cache instead of waiting on poppler.
+    def prefetch_adjacent_pages(self, pdf_path, page, total_pages,
+                                target_height=None):
+        for neighbor in (page + 1, page - 1):
+            if 1 <= neighbor <= total_pages:
+                threading.Thread(target=prefetch_preview_image,
+                                 args=(pdf_path, neighbor, target_height),
+                                 daemon=True).start()
+
     def select_pdf(self):
         file_path = filedialog.askopenfilename(title="Select PDF File", filetypes=[("PDF files", "*.pdf")])
         if file_path:
             self.input_pdf_path = file_path
             self.pdf_label.config(text=os.path.basename(file_path))
-            # Get total pages of the original PDF.
+            # Parse the PDF once and keep the reader for later steps.
             try:
-                with open(self.input_pdf_path, 'rb') as f:
-                    reader = PyPDF2.PdfReader(f)
-                    self.original_total_pages = len(reader.pages)
+                with _open_pdf(self.input_pdf_path) as f:
+                    self.reader_bytes = f.read()
+                self.reader = PyPDF2.PdfReader(io.BytesIO(self.reader_bytes),
+                                               strict=False)
+                self.original_total_pages = len(self.reader.pages)
             except Exception as e:
                 messagebox.showerror("Error", "Failed to read PDF: " + str(e))
                 return
@@ -279,24 +919,58 @@ class PDFTranslatorApp:
 
     def display_original_preview(self, page):
         try:
-            img = get_pdf_preview_image(self.input_pdf_path, page_number=page)
+            target_height = self.canvas_height(self.original_canvas)
+            img = get_pdf_preview_image(self.input_pdf_path, page_number=page,
+                                        target_height=target_height)
+            img = self.fit_to_canvas(img, self.original_canvas)
             self.original_image_tk = ImageTk.PhotoImage(img)
             self.original_canvas.delete("all")
             self.original_canvas.create_image(0, 0, anchor="nw", image=self.original_image_tk)
             self.orig_page_label.config(text=f"Page {page} of {self.original_total_pages}")
+            self.prefetch_adjacent_pages(self.input_pdf_path, page,
+                                         self.original_total_pages,
+                                         target_height)
         except Exception as e:
             messagebox.showerror("Error", "Original preview: " + str(e))
 
+    # Cached render of one translated-PDF page straight from the in-memory
+    # bytes; the cache is reset whenever a new translation finishes.
+    def get_translated_preview_image(self, page, target_height=None):
+        key = (page, target_height)
+        img = self.translated_preview_cache.get(key)
+        if img is None:
+            img = _render_pdf_page(convert_from_bytes, self.translated_bytes,
+                                   page, target_height)
+            self.translated_preview_cache[key] = img
+        return img
+
     def display_translated_preview(self, page):
+        if not self.translated_bytes:
+            return
         try:
-            img = get_pdf_preview_image(self.output_pdf_path, page_number=page)
+            target_height = self.canvas_height(self.translated_canvas)
+            img = self.get_translated_preview_image(page, target_height)
+            img = self.fit_to_canvas(img, self.translated_canvas)
             self.translated_image_tk = ImageTk.PhotoImage(img)
             self.translated_canvas.delete("all")
             self.translated_canvas.create_image(0, 0, anchor="nw", image=self.translated_image_tk)
             self.trans_page_label.config(text=f"Page {page} of {self.translated_total_pages}")
+            self.prefetch_translated_pages(page, target_height)
         except Exception as e:
             messagebox.showerror("Error", "Translated preview: " + str(e))
 
+    # Background warm-up of the translated-preview cache for Prev/Next.
+    def prefetch_translated_pages(self, page, target_height=None):
+        def warm(neighbor):
+            try:
+                self.get_translated_preview_image(neighbor, target_height)
+            except Exception:
+                pass
+        for neighbor in (page + 1, page - 1):
+            if 1 <= neighbor <= self.translated_total_pages:
+                threading.Thread(target=warm, args=(neighbor,),
+                                 daemon=True).start()
+
     def prev_original_page(self):
         if self.original_current_page > 1:
             self.original_current_page -= 1
@@ -321,7 +995,8 @@ class PDFTranslatorApp:
         save_path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF files", "*.pdf")])
         if save_path:
             try:
-                shutil.copy(self.output_pdf_path, save_path)
+                with open(save_path, 'wb') as f:
+                    f.write(self.translated_bytes)
                 messagebox.showinfo("Saved", f"Translated PDF saved to {save_path}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save PDF: {str(e)}")
@@ -342,21 +1017,26 @@ class PDFTranslatorApp:
 
         def process_translation():
             try:
-                # Extract text with OCR (50% progress).
-                extracted_text = extract_text_from_pdf(self.input_pdf_path, progress_callback=self.update_progress)
-                self.update_progress(50)
-                # Translate text (progress to 75%).
-                translated_text = translate_text(extracted_text, source_lang, target_lang)
+                # Extract and translate with the stages overlapped
+                # (extraction 0-50%, translation 50-75%).
+                translated_text = translate_pdf_text(
+                    self.input_pdf_path, source_lang, target_lang,
+                    progress_callback=self.update_progress,
+                    reader=self.reader)
                 self.update_progress(75)
-                # Create the translated PDF.
-                create_translated_pdf(translated_text, self.output_pdf_path)
+                # Create the translated PDF in memory; it is only written
+                # to disk when the user saves it.
+                buf = io.BytesIO()
+                create_translated_pdf(translated_text, buf)
+                self.translated_bytes = buf.getvalue()
+                self.translated_preview_cache = {}
                 self.update_progress(100)
-                self.master.after(0, lambda: messagebox.showinfo("Success", f"Translated PDF saved as {self.output_pdf_path}"))
+                self.master.after(0, lambda: messagebox.showinfo("Success", "Translation finished. Use 'Save Translated PDF' to write it to disk."))
                 # After creation, get total pages of translated PDF.
                 try:
-                    with open(self.output_pdf_path, 'rb') as f:
-                        reader = PyPDF2.PdfReader(f)
-                        self.translated_total_pages = len(reader.pages)
+                    reader = PyPDF2.PdfReader(io.BytesIO(self.translated_bytes),
+                                              strict=False)
+                    self.translated_total_pages = len(reader.pages)
                 except Exception as e:
                     self.translated_total_pages = 1
                 self.translated_current_page = 1
@@ -378,9 +1058,9 @@ class PDFTranslatorApp:
         threading.Thread(target=process_translation).start()
 
 def main():
-    install_required_language_pairs()
     root = tk.Tk()
     app = PDFTranslatorApp(root)
+    app.start_language_install()
     root.mainloop()
 
 if __name__ == "__main__":